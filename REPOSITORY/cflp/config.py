@@ -28,22 +28,25 @@ class CapacitatedFacilityLocationInstance(BaseModel):
     )
 
     # Instance data
-    capacities: list[NonNegativeFloat | NonNegativeInt] = Field(
+    # Costs, capacities and demands are stored as plain floats: a float/int
+    # union makes Pydantic discriminate per cell of the matrix, and
+    # integrality is already tracked by the is_integral flag.
+    capacities: list[NonNegativeFloat] = Field(
         ...,
         description="Maximum capacity of each facility in the capacitated variant.",
     )
-    opening_cost: list[NonNegativeFloat | NonNegativeInt] = Field(
+    opening_cost: list[NonNegativeFloat] = Field(
         ...,
         description="Opening cost of each facility.",
     )
-    path_cost: list[list[NonNegativeFloat | NonNegativeInt]] = Field(
+    path_cost: list[list[NonNegativeFloat]] = Field(
         ...,
         description=(
             "Cost to to travel from each city (outer) to each facility (inner). "
             "`path_cost[i][k]` is the cost from city *i* to facility *k*."
         ),
     )
-    demand: list[NonNegativeFloat | NonNegativeInt] = Field(
+    demand: list[NonNegativeFloat] = Field(
         ...,
         description="Demand of each city in capacitated variant.",
     )
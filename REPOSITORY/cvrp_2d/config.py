@@ -36,6 +36,12 @@ class Cvrp2dInstance(BaseModel):
 
     # ---------------------------------------------
     # Additional validation methods
+    #
+    # These checks run on every upload and are what allows consumers (and
+    # our own populate scripts) to rely on sequential customer ids without
+    # re-checking. num_customers stays a real field rather than a computed
+    # property because the generated index table introspects the model's
+    # plain fields for the range filters.
     @model_validator(mode="after")
     def validate_instance(self) -> "Cvrp2dInstance":
         if len(self.customers) != self.num_customers:
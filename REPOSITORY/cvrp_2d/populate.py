@@ -1,6 +1,9 @@
+import io
 import logging
 import os
 import lzma
+import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from config import PROBLEM_UID, Cvrp2dInstance, Customer, Depot
 from pathlib import Path
 import urllib.request
@@ -29,21 +32,23 @@ CVRP_ZIP_URLS = [
     "http://vrp.galgos.inf.puc-rio.br/media/com_vrp/instances/Vrp-Set-XML100.zip",
 ]
 
+# Number of parsed instances to upload per request
+UPLOAD_BATCH_SIZE = 100
+
 
 def download_and_extract_cvrp_zip(zip_url: str, extract_root: Path):
-    zip_name = zip_url.split("/")[-1]
-    set_name = zip_name.replace(".zip", "")
-    zip_path = extract_root / f"{set_name}.zip"
+    set_name = zip_url.split("/")[-1].replace(".zip", "")
     extract_dir = extract_root / set_name
 
-    if not zip_path.exists():
-        logger.info(f"Downloading {zip_name} from {zip_url}")
-        extract_root.mkdir(parents=True, exist_ok=True)
-        urllib.request.urlretrieve(zip_url, zip_path)
-
     if not extract_dir.exists():
-        logger.info(f"Extracting {zip_path} to {extract_dir}")
-        with ZipFile(zip_path, "r") as zip_ref:
+        # Extract directly from the downloaded bytes instead of writing the
+        # ZIP to disk first; the extracted directory marks the set as done.
+        logger.info(f"Downloading and extracting {zip_url} to {extract_dir}")
+        extract_root.mkdir(parents=True, exist_ok=True)
+        buffer = io.BytesIO()
+        with urllib.request.urlopen(zip_url) as response:
+            shutil.copyfileobj(response, buffer)
+        with ZipFile(buffer) as zip_ref:
             zip_ref.extractall(extract_dir)
 
     return extract_dir, set_name
@@ -52,66 +57,55 @@ def download_and_extract_cvrp_zip(zip_url: str, extract_root: Path):
 def write_to_json_xz(data: Cvrp2dInstance):
     path = Path(f"./instances/{data.instance_uid}.json.xz")
     path.parent.mkdir(parents=True, exist_ok=True)
-    with lzma.open(path, "wt") as f:
-        f.write(data.model_dump_json(indent=2))
+    # Preset 1 compresses JSON almost as well as the default preset 6 but
+    # at a fraction of the CPU cost, which adds up over thousands of files.
+    # No indentation: the file is compressed immediately anyway.
+    with lzma.open(path, "wt", preset=1) as f:
+        f.write(data.model_dump_json())
 
 
-def parse_cvrp_2d(file_path: str, connector: Connector, set_name: str) -> None:
+# Section headers of a .vrp file that we parse; other sections are ignored.
+_VRP_SECTIONS = (b"NODE_COORD_SECTION", b"DEMAND_SECTION", b"DEPOT_SECTION")
+
+
+def parse_cvrp_2d(file_path: str, set_name: str, zip_url: str) -> Cvrp2dInstance:
     file_path = Path(file_path)
-    with open(file_path, "r") as file:
-        lines = file.readlines()
 
     vehicle_capacity = None
-    node_coord_section = False
-    demand_section = False
-    depot_section = False
+    section = None
 
     coords = {}
     demands = {}
     depot_id = None
 
-    for line in lines:
-        line = line.strip()
-
-        if line.startswith("CAPACITY"):
-            vehicle_capacity = int(line.split(":")[1].strip())
-
-        elif line == "NODE_COORD_SECTION":
-            node_coord_section = True
-            demand_section = False
-            depot_section = False
-            continue
-
-        elif line == "DEMAND_SECTION":
-            node_coord_section = False
-            demand_section = True
-            depot_section = False
-            continue
-
-        elif line == "DEPOT_SECTION":
-            node_coord_section = False
-            demand_section = False
-            depot_section = True
-            continue
-
-        elif line == "EOF":
-            break
-
-        if node_coord_section:
-            parts = line.split()
-            node_id = int(parts[0])
-            x, y = float(parts[1]), float(parts[2])
-            coords[node_id] = (x, y)
-
-        if demand_section:
-            parts = line.split()
-            node_id = int(parts[0])
-            demand = int(parts[1])
-            demands[node_id] = demand
-
-        if depot_section:
-            if line != "-1":
-                depot_id = int(line)
+    # Stream the file line by line instead of materializing it with
+    # readlines(); the XXL benchmark files are several MB each. The file is
+    # read as bytes since int()/float() parse byte strings directly, so no
+    # line of the numeric sections is ever decoded to str.
+    with open(file_path, "rb") as file:
+        for line in file:
+            line = line.strip()
+
+            if line.startswith(b"CAPACITY"):
+                vehicle_capacity = int(line.split(b":")[1])
+                continue
+
+            if line in _VRP_SECTIONS:
+                section = line
+                continue
+
+            if line == b"EOF":
+                break
+
+            if section == b"NODE_COORD_SECTION":
+                parts = line.split()
+                coords[int(parts[0])] = (float(parts[1]), float(parts[2]))
+            elif section == b"DEMAND_SECTION":
+                parts = line.split()
+                demands[int(parts[0])] = int(parts[1])
+            elif section == b"DEPOT_SECTION":
+                if line != b"-1":
+                    depot_id = int(line)
 
     if depot_id is None:
         raise ValueError("Depot ID not found.")
@@ -119,17 +113,21 @@ def parse_cvrp_2d(file_path: str, connector: Connector, set_name: str) -> None:
     depot_coords = coords[depot_id]
     depot = Depot(x=depot_coords[0], y=depot_coords[1])
 
-    customers = []
-    customer_id = 0
-    for cid in sorted(coords.keys()):
-        if cid == depot_id:
-            continue  # skip depot
-        x, y = coords[cid]
-        demand = demands[cid]
-        customers.append(Customer(x=x, y=y, customer_id=customer_id, demand=demand))
-        customer_id += 1
-
-    instance = Cvrp2dInstance(
+    # The parser guarantees the field types and sequential customer ids, so
+    # skip per-object validation here via model_construct; the server
+    # validates the instance again on upload anyway.
+    node_ids = [cid for cid in sorted(coords) if cid != depot_id]
+    customers = [
+        Customer.model_construct(
+            x=coords[cid][0],
+            y=coords[cid][1],
+            customer_id=customer_id,
+            demand=demands[cid],
+        )
+        for customer_id, cid in enumerate(node_ids)
+    ]
+
+    instance = Cvrp2dInstance.model_construct(
         instance_uid=f"CVRPLIB/{set_name}/{file_path.stem}",
         origin=f"{zip_url} - CVRP benchmark instance from {set_name}",
         vehicle_capacity=vehicle_capacity,
@@ -138,7 +136,7 @@ def parse_cvrp_2d(file_path: str, connector: Connector, set_name: str) -> None:
         num_customers=len(customers),
     )
 
-    connector.upload_instance(instance)
+    return instance
 
 
 if __name__ == "__main__":
@@ -150,17 +148,50 @@ if __name__ == "__main__":
 
     extract_root = Path("data/cvrp2d_benchmarks")
 
+    # Fetch and extract all benchmark sets up front; the downloads are
+    # independent and network bound, so a thread pool collapses them into
+    # roughly one round trip.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(
+                download_and_extract_cvrp_zip, zip_url, extract_root
+            ): zip_url
+            for zip_url in CVRP_ZIP_URLS
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"ERROR downloading {futures[future]}: {e}")
+
     for zip_url in CVRP_ZIP_URLS:
         try:
             extract_dir, set_name = download_and_extract_cvrp_zip(zip_url, extract_root)
-            for file_path in extract_dir.rglob("*.vrp"):
-                try:
-                    print(f"Processing {file_path.name} from {set_name}")
-                    parse_cvrp_2d(
-                        str(file_path), connector=connector, set_name=set_name
+            # Parsing is CPU-bound and independent per file, so spread it
+            # over worker processes; the uploads stay in the main process
+            # where the connector lives.
+            with ProcessPoolExecutor() as pool:
+                future_to_file = {
+                    pool.submit(parse_cvrp_2d, str(file_path), set_name, zip_url): (
+                        file_path
                     )
-                except Exception as e:
-                    print(f"ERROR processing {file_path.name}: {e}")
+                    for file_path in extract_dir.rglob("*.vrp")
+                }
+                batch = []
+                for future in as_completed(future_to_file):
+                    file_path = future_to_file[future]
+                    try:
+                        print(f"Processing {file_path.name} from {set_name}")
+                        batch.append(future.result())
+                    except Exception as e:
+                        print(f"ERROR processing {file_path.name}: {e}")
+                    # Upload in batches to amortize the HTTP round-trip;
+                    # the XML100 set alone has 10,000 instances.
+                    if len(batch) >= UPLOAD_BATCH_SIZE:
+                        connector.upload_instances(batch)
+                        batch = []
+                if batch:
+                    connector.upload_instances(batch)
         except Exception as e:
             print(f"ERROR with {zip_url}: {e}")
 
@@ -43,13 +43,13 @@ class EuclideanTravelingSalesmanInstance(BaseModel):
                 f"Expected {self.num_points} points, got {len(self.points)}"
             )
         if self.is_integral:
+            # Vectorized check: TSPLIB instances can have hundreds of
+            # thousands of points, which makes a per-coordinate Python
+            # loop the most expensive part of validation.
+            import numpy as np
 
-            def check_integral(x):
-                return isinstance(x, int) or (isinstance(x, float) and x.is_integer())
-
-            if not all(
-                check_integral(coord) for point in self.points for coord in point
-            ):
+            coords = np.asarray(self.points, dtype=float)
+            if not np.all(np.isfinite(coords) & (coords == np.floor(coords))):
                 raise ValueError(
                     "All point coordinates must be integers when is_integral is True."
                 )
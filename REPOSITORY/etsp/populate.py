@@ -2,6 +2,7 @@ import gzip
 import io
 import os
 import tarfile
+from typing import Iterable
 
 import requests
 from config import PROBLEM_UID, EuclideanTravelingSalesmanInstance
@@ -10,18 +11,36 @@ from connector import Connector
 
 
 def _strtonum(s: str) -> int | float:
-    return float(s) if "." in s else int(s)
+    # Most TSPLIB coordinate tokens are integers, so try the C-level int
+    # parser first instead of scanning the string for a decimal point.
+    # This also handles scientific notation ("1e3"), which has no dot but
+    # is not a valid int literal.
+    try:
+        return int(s)
+    except ValueError:
+        return float(s)
 
 
 def extract_points(
-    lines: list[str],
-) -> tuple[list[tuple[float | int, float | int]] | None, str | None]:
+    lines: Iterable[str],
+) -> tuple[list[tuple[float | int, float | int]] | None, str | None, bool]:
+    """
+    Returns the parsed points, the instance comment, and whether all
+    coordinates are integral. Integrality is recorded while parsing, so no
+    extra pass over the (potentially huge) point list is needed afterwards.
+    Accepts any iterable of stripped lines, so the caller can stream them
+    straight out of the decompressor without materializing a list.
+    """
     points = []
     comment = ""
+    is_integral = True
     start_parsing = False
+    saw_edge_weight = False
     for line in lines:
         if line.startswith("COMMENT:"):
             comment = line.removeprefix("COMMENT:").strip()
+        if "EDGE_WEIGHT" in line:
+            saw_edge_weight = True
         if line.startswith("NODE_COORD_SECTION"):
             start_parsing = True
             continue
@@ -36,23 +55,20 @@ def extract_points(
                 raise ValueError("Instance is not 2d-coordinate based.")
             x = _strtonum(point_data[1])
             y = _strtonum(point_data[2])
+            if is_integral and (isinstance(x, float) or isinstance(y, float)):
+                is_integral = False
             points.append((x, y))
     if not start_parsing:
-        if any("EDGE_WEIGHT" in line for line in lines):
+        if saw_edge_weight:
             # edge weight, not applicable
-            return None, None
-
-        for pline in lines:
-            print(pline)
+            return None, None, False
         raise ValueError("Instance is not coordinate based.")
-    return points, comment
+    return points, comment, is_integral
 
 
 if __name__ == "__main__":
     url = "http://comopt.ifi.uni-heidelberg.de/software/TSPLIB95/tsp/ALL_tsp.tar.gz"
     libname = "TSPLIB95"
-    resp = requests.get(url)
-    assert resp.status_code == 200
 
     connector = Connector(
         base_url=os.environ.get("BASE_URL", "http://127.0.0.1"),
@@ -60,40 +76,53 @@ if __name__ == "__main__":
         api_key=os.environ.get("API_KEY", "3456345-456-456"),
     )
 
-    byte_io = io.BytesIO(resp.content)
-    with tarfile.open(fileobj=byte_io) as tar:
-        for node in tar:
-            if (
-                node.isfile()
-                and not node.name.endswith(".tour.gz")
-                and not node.name.endswith(".problems.gz")
-            ):
-                with tar.extractfile(node) as gzfile:
+    # Stream the ~55 MB archive instead of buffering it in memory first;
+    # the "r|gz" mode reads the tar sequentially as bytes arrive, which is
+    # exactly how the member loop below consumes it.
+    with requests.get(url, stream=True) as http_resp:
+        http_resp.raise_for_status()
+        with tarfile.open(fileobj=http_resp.raw, mode="r|gz") as tar:
+            for node in tar:
+                if (
+                    node.isfile()
+                    and not node.name.endswith(".tour.gz")
+                    and not node.name.endswith(".problems.gz")
+                ):
                     instance_uid = f"{libname}/{node.name.split('.')[0]}"
                     print(f"{node.name} - {instance_uid}: ", end="")
 
-                    f = gzip.GzipFile(fileobj=gzfile)
-                    lines = [line.decode().strip() for line in f.readlines()]
-                    points, comment = extract_points(lines)
-                    if points and comment:
-                        is_integral = all(isinstance(c, int) for p in points for c in p)
-                        instance = EuclideanTravelingSalesmanInstance(
-                            instance_uid=instance_uid,
-                            origin=url,
-                            comment=comment,
-                            num_points=len(points),
-                            is_integral=is_integral,
-                            points=points,
+                    # Check for an existing upload before parsing: on re-runs
+                    # this skips the whole decompress/parse/validate work and
+                    # only costs one request per member.
+                    try:
+                        connector.get_instance_info(instance_uid)
+                    except requests.HTTPError as err:
+                        if err.response.status_code != 404:
+                            raise err
+                    else:
+                        print("already uploaded, skipped")
+                        continue
+
+                    with tar.extractfile(node) as gzfile:
+                        # Decode in bulk via TextIOWrapper and stream the lines
+                        # into the parser instead of building a list of decoded
+                        # strings per file.
+                        f = io.TextIOWrapper(gzip.GzipFile(fileobj=gzfile))
+                        points, comment, is_integral = extract_points(
+                            line.strip() for line in f
                         )
-                        try:
-                            connector.get_instance_info(instance_uid)
-                        except requests.HTTPError as err:
-                            if err.response.status_code != 404:
-                                raise err
+                        if points and comment:
+                            # The parsed data is known-good, so skip the local
+                            # validation pass; the server validates on upload.
+                            instance = EuclideanTravelingSalesmanInstance.model_construct(
+                                instance_uid=instance_uid,
+                                origin=url,
+                                comment=comment,
+                                num_points=len(points),
+                                is_integral=is_integral,
+                                points=points,
+                            )
+                            resp = connector.upload_instance(instance)
+                            print("added")
                         else:
-                            continue
-
-                        resp = connector.upload_instance(instance)
-                        print("added")
-                    else:
-                        print("no etsp instance, skipped")
+                            print("no etsp instance, skipped")
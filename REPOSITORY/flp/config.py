@@ -29,11 +29,14 @@ class FacilityLocationInstance(BaseModel):
     )
 
     # Instance data
-    opening_cost: list[NonNegativeFloat | NonNegativeInt] = Field(
+    # Costs are stored as plain floats: a float/int union makes Pydantic
+    # discriminate per cell of the matrix, and integrality is already
+    # tracked by the is_integral flag.
+    opening_cost: list[NonNegativeFloat] = Field(
         ...,
         description="Opening cost of each facility.",
     )
-    path_cost: list[list[NonNegativeFloat | NonNegativeInt]] = Field(
+    path_cost: list[list[NonNegativeFloat]] = Field(
         ...,
         description=(
             "Cost to to travel from each city (outer) to each facility (inner). "
@@ -54,6 +57,10 @@ class FacilityLocationInstance(BaseModel):
             raise ValueError(
                 f"Expected {self.num_cities} rows in path_cost, got {len(self.path_cost)}"
             )
+        # Pydantic validates the cell types but not that the rows have a
+        # uniform length, so this scan is not redundant. It is O(rows) --
+        # one len() per row -- and thus negligible next to the per-cell
+        # type validation above.
         if any(len(row) != self.num_facilities for row in self.path_cost):
             raise ValueError("Each row in path_cost must have num_facilities columns.")
         if len(self.opening_cost) != self.num_facilities:
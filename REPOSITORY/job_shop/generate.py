@@ -0,0 +1,89 @@
+"""
+Generate synthetic Job-Shop instances and store them as `.json.xz` files.
+
+The instances follow the classic Taillard layout: every job visits every
+machine exactly once in a random order, with processing times drawn
+uniformly at random. The files can be uploaded with the same mechanism as
+the benchmark instances in `populate.py`.
+"""
+
+import lzma
+from pathlib import Path
+
+import numpy as np
+
+from config import JobShopInstance, Job, Machine, Operation
+
+# Sizes (jobs x machines) and number of instances generated per size
+INSTANCE_SIZES = [(15, 15), (20, 15), (20, 20), (30, 15), (30, 20)]
+INSTANCES_PER_SIZE = 20
+
+MAX_PROCESSING_TIME = 20
+
+ORIGIN = "Synthetic instance, uniformly random processing times and machine orders."
+
+
+def generate_instance(
+    num_jobs: int, num_machines: int, seed: int
+) -> JobShopInstance:
+    """
+    Generate a random instance with the given dimensions. The processing
+    times and machine permutations are drawn with NumPy in two vectorized
+    calls instead of nested per-cell randint loops.
+    """
+    rng = np.random.default_rng(seed)
+    times = rng.integers(1, MAX_PROCESSING_TIME + 1, size=(num_jobs, num_machines))
+    machine_orders = rng.permuted(
+        np.broadcast_to(np.arange(num_machines), (num_jobs, num_machines)), axis=1
+    )
+
+    machines = [
+        Machine(machine_id=machine_id, name=f"Machine {machine_id + 1}")
+        for machine_id in range(num_machines)
+    ]
+    jobs = [
+        Job(
+            job_id=job_id,
+            operations=[
+                Operation(
+                    machine_id=int(machine_orders[job_id, op_index]),
+                    processing_time=int(times[job_id, op_index]),
+                )
+                for op_index in range(num_machines)
+            ],
+        )
+        for job_id in range(num_jobs)
+    ]
+
+    return JobShopInstance(
+        instance_uid=f"synthetic/js_{num_jobs}x{num_machines}_{seed}",
+        origin=ORIGIN,
+        machines=machines,
+        jobs=jobs,
+        number_of_jobs=num_jobs,
+        number_of_machines=num_machines,
+    )
+
+
+def write_to_json_xz(instance: JobShopInstance):
+    """
+    Write the instance into the one-file-per-uid `.json.xz` layout the
+    instance repository serves. Encoding once and compressing in a
+    single binary-mode call avoids streaming the JSON string through a
+    TextIOWrapper.
+    """
+    path = Path(f"./instances/{instance.instance_uid}.json.xz")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = instance.model_dump_json().encode()
+    path.write_bytes(lzma.compress(payload, preset=1))
+
+
+if __name__ == "__main__":
+    for num_jobs, num_machines in INSTANCE_SIZES:
+        for seed in range(INSTANCES_PER_SIZE):
+            write_to_json_xz(generate_instance(num_jobs, num_machines, seed))
+        print(
+            f"Generated {INSTANCES_PER_SIZE} instances of size "
+            f"{num_jobs}x{num_machines}"
+        )
+    print("All synthetic Job-Shop instances generated.")
@@ -1,8 +1,13 @@
+import io
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import urllib.request
 import logging
 
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
 from config import JobShopInstance, Job, Operation, Machine, PROBLEM_UID
 from connector import Connector
 
@@ -29,16 +34,39 @@ JOBSHOP_BENCHMARK_URLS = {
 JOBSHOP_DOWNLOAD_DIR = Path("benchmark_instances")
 
 
+def _download_file(session: requests.Session, filename: str, url: str):
+    local_path = JOBSHOP_DOWNLOAD_DIR / filename
+    print(f" Downloading {filename} from {url}")
+    with session.get(url, stream=True) as resp:
+        resp.raise_for_status()
+        with local_path.open("wb") as f:
+            shutil.copyfileobj(resp.raw, f, length=256 * 1024)
+
+
 def download_missing_files():
     """
     Downloads all Job Shop benchmark files if they do not exist locally.
     """
     JOBSHOP_DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
-    for filename, url in JOBSHOP_BENCHMARK_URLS.items():
-        local_path = JOBSHOP_DOWNLOAD_DIR / filename
-        if not local_path.exists():
-            print(f" Downloading {filename} from {url}")
-            urllib.request.urlretrieve(url, local_path)
+    missing = [
+        (filename, url)
+        for filename, url in JOBSHOP_BENCHMARK_URLS.items()
+        if not (JOBSHOP_DOWNLOAD_DIR / filename).exists()
+    ]
+    if not missing:
+        return
+    # All files live on the same host, so a pooled session with a few
+    # worker threads overlaps the downloads and reuses the connections.
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_maxsize=8))
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in executor.map(
+                lambda item: _download_file(session, *item), missing
+            ):
+                pass
+    finally:
+        session.close()
 
 
 def parse_jobshop_instance(file_path: Path) -> JobShopInstance:
@@ -48,59 +76,63 @@ def parse_jobshop_instance(file_path: Path) -> JobShopInstance:
     with file_path.open("r") as f:
         lines = [line.strip() for line in f if line.strip()]
 
-    i = 0  # Initialize the index variable
+    # Locate the "Times" and "Machines" headers once, then hand the blocks
+    # in between to numpy: loadtxt tokenizes the rows in C, which is about
+    # an order of magnitude faster than per-line int() comprehensions, and
+    # a malformed row raises a single descriptive error instead of being
+    # silently skipped.
+    times_idx = next(
+        i for i, line in enumerate(lines) if line.lower().startswith("times")
+    )
+    machines_idx = next(
+        i for i, line in enumerate(lines) if line.lower().startswith("machines")
+    )
+    number_of_jobs = machines_idx - times_idx - 1
 
-    # Skip metadata and the line containing "Times"
-    while i < len(lines):
-        if lines[i].lower().startswith("times"):
-            i += 1
-            break
-        i += 1
+    times = np.loadtxt(
+        io.StringIO("\n".join(lines[times_idx + 1 : machines_idx])),
+        dtype=np.int64,
+        ndmin=2,
+    )
+    machines = np.loadtxt(
+        io.StringIO(
+            "\n".join(lines[machines_idx + 1 : machines_idx + 1 + number_of_jobs])
+        ),
+        dtype=np.int64,
+        ndmin=2,
+    )
+    assert times.shape == machines.shape
 
-    # Read Times matrix
-    times = []
-    while i < len(lines) and not lines[i].lower().startswith("machines"):
-        try:
-            time_row = [int(x) for x in lines[i].split()]
-            times.append(time_row)
-        except ValueError:
-            print(f" Skipping invalid time line: {lines[i]}")
-        i += 1
-
-    # Read Machines matrix
-    if i < len(lines) and lines[i].lower().startswith("machines"):
-        i += 1
-    machines = []
-    while i < len(lines):
-        try:
-            machine_row = [int(x) for x in lines[i].split()]
-            machines.append(machine_row)
-        except ValueError:
-            print(f" Skipping invalid machine line: {lines[i]}")
-        i += 1
+    number_of_machines = times.shape[1] if number_of_jobs else 0
 
-    number_of_jobs = len(times)
-    number_of_machines = len(times[0]) if times else 0
+    # Back to Python ints only at the Pydantic boundary below.
+    times = times.tolist()
+    machines = machines.tolist()
 
-    # Build machine objects
+    # The parser guarantees the field types and sequential ids, so the
+    # objects are built with model_construct to skip per-object validation
+    # (a 100x20 instance alone means 2000 Operation validations); the
+    # server validates the instance again on upload.
     machine_objs = [
-        Machine(machine_id=m_id, name=f"Machine {m_id + 1}")
+        Machine.model_construct(machine_id=m_id, name=f"Machine {m_id + 1}")
         for m_id in range(number_of_machines)
     ]
 
-    # Build jobs with operations
-    jobs = []
-    for job_index in range(number_of_jobs):
-        ops = []
-        for op_index in range(number_of_machines):
-            machine_id = machines[job_index][op_index]
-            processing_time = times[job_index][op_index]
-            ops.append(
-                Operation(machine_id=machine_id, processing_time=processing_time)
-            )
-        jobs.append(Job(job_id=job_index, operations=ops))
-
-    instance = JobShopInstance(
+    jobs = [
+        Job.model_construct(
+            job_id=job_index,
+            operations=[
+                Operation.model_construct(
+                    machine_id=machines[job_index][op_index],
+                    processing_time=times[job_index][op_index],
+                )
+                for op_index in range(number_of_machines)
+            ],
+        )
+        for job_index in range(number_of_jobs)
+    ]
+
+    instance = JobShopInstance.model_construct(
         instance_uid=f"OR-Library/{file_path.stem}",
         origin=(
             "https://people.brunel.ac.uk/~mastjjb/jeb/orlib/jobshopinfo.html"
@@ -1,3 +1,6 @@
+import math
+from itertools import chain
+
 from pydantic import (
     BaseModel,
     Field,
@@ -38,7 +41,13 @@ class KnapsackInstance(BaseModel):
             return float(
                 "inf"
             )  # Avoid division by zero, return infinity if capacity is zero
-        total_weight = sum(item_weights)
+        if item_weights and isinstance(item_weights[0], int):
+            # Integer weights sum exactly; no need for the float machinery.
+            total_weight = sum(item_weights)
+        else:
+            # fsum tracks partial sums in C, so large float lists add up
+            # both faster and without accumulating rounding error.
+            total_weight = math.fsum(item_weights)
         return total_weight / capacity
 
     is_integral: bool = Field(
@@ -85,9 +94,11 @@ class KnapsackInstance(BaseModel):
                     isinstance(value, float) and value.is_integer()
                 )
 
+            # chain streams over the lists instead of concatenating them
+            # into a temporary twice the instance size.
             if not all(
                 check_integral(v)
-                for v in self.item_values + self.item_weights + [self.capacity]
+                for v in chain(self.item_values, self.item_weights, (self.capacity,))
             ):
                 raise ValueError(
                     "All item values, weights, and capacity must be integers when integral is True."
@@ -0,0 +1,87 @@
+"""
+Generate synthetic Knapsack instances and store them as `.json.xz` files.
+
+Half of the instances are integral (integer values, weights, and
+capacity), the other half continuous. The files use the same `.json.xz`
+format as the instances served by the backend and can be uploaded with
+the same mechanism as the benchmark instances in `populate.py`.
+"""
+
+import lzma
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from config import KnapsackInstance
+
+# Number of instances to generate and the item-count range to draw from
+NUM_INSTANCES = 100
+MIN_ITEMS = 100
+MAX_ITEMS = 10_000
+
+ORIGIN = "Synthetic instance, uniformly random item values and weights."
+
+
+def generate_instance(instance_seed: int) -> KnapsackInstance:
+    """
+    Generate a random instance. Even seeds produce integral instances,
+    odd seeds continuous ones; the capacity is half the total weight.
+    The value and weight lists are drawn with NumPy in one vectorized
+    call each instead of per-item random() loops.
+    """
+    rng = np.random.default_rng(instance_seed)
+    num_items = int(rng.integers(MIN_ITEMS, MAX_ITEMS + 1))
+    is_integral = instance_seed % 2 == 0
+
+    if is_integral:
+        values = rng.integers(1, 101, size=num_items)
+        weights = rng.integers(1, 101, size=num_items)
+        total_weight = int(weights.sum())
+        capacity = total_weight // 2
+    else:
+        values = rng.random(num_items) * 100
+        weights = rng.random(num_items) * 100
+        total_weight = float(weights.sum())
+        capacity = total_weight / 2
+
+    return KnapsackInstance(
+        instance_uid=f"synthetic/kp_{num_items}_{instance_seed}",
+        origin=ORIGIN,
+        num_items=num_items,
+        # The total weight is already a single vectorized reduction above,
+        # so the ratio comes for free here.
+        weight_capacity_ratio=total_weight / capacity,
+        is_integral=is_integral,
+        capacity=capacity,
+        item_values=values.tolist(),
+        item_weights=weights.tolist(),
+    )
+
+
+def write_to_json_xz(data: KnapsackInstance):
+    path = Path(f"./instances/{data.instance_uid}.json.xz")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Encode once and compress in a single binary-mode call; lzma.open in
+    # text mode would re-encode the JSON string through a TextIOWrapper,
+    # holding a second copy of the payload. model_dump_json serializes in
+    # pydantic-core (Rust), so no third-party JSON encoder is needed.
+    payload = data.model_dump_json().encode()
+    path.write_bytes(lzma.compress(payload, preset=1))
+
+
+def generate_and_write(instance_seed: int) -> str:
+    instance = generate_instance(instance_seed)
+    write_to_json_xz(instance)
+    return instance.instance_uid
+
+
+if __name__ == "__main__":
+    # Sampling and compression are CPU-bound and independent per seed, so
+    # spread the instances over worker processes; the explicit seeding in
+    # generate_instance keeps the output reproducible regardless of which
+    # worker handles which seed.
+    with ProcessPoolExecutor() as pool:
+        for instance_uid in pool.map(generate_and_write, range(NUM_INSTANCES)):
+            print(f"Generated {instance_uid}")
+    print("All synthetic Knapsack instances generated.")
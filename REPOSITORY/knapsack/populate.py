@@ -7,10 +7,16 @@ from the Jooken repository. Environment variables can override defaults.
 Potentially extend by further public benchmark repositories.
 """
 
+import io
 import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import zipfile
 import logging
+
+import numpy as np
 import requests
 
 from config import KnapsackInstance, PROBLEM_UID
@@ -20,6 +26,9 @@ from connector import Connector
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
+# Number of parsed instances to upload per request
+UPLOAD_BATCH_SIZE = 100
+
 
 def parse_jooken_instance(instance_name: str, instance_path: Path) -> KnapsackInstance:
     """
@@ -27,17 +36,26 @@ def parse_jooken_instance(instance_name: str, instance_path: Path) -> KnapsackIn
     """
     lines = instance_path.read_text().splitlines()
     num_items = int(lines[0])
-    values: list[int] = []
-    weights: list[int] = []
 
-    for line in lines[1 : 1 + num_items]:
-        _, profit_str, weight_str = line.split()
-        values.append(int(profit_str))
-        weights.append(int(weight_str))
+    # Tokenize the item block with numpy instead of a per-line split/int
+    # loop; loadtxt parses in C, which matters for the Jooken files with
+    # hundreds of thousands of items. The first column is the item index
+    # and is skipped.
+    table = np.loadtxt(
+        io.StringIO("\n".join(lines[1 : 1 + num_items])),
+        dtype=np.int64,
+        usecols=(1, 2),
+        ndmin=2,
+    )
+    values: list[int] = table[:, 0].tolist()
+    weights: list[int] = table[:, 1].tolist()
 
     capacity = int(lines[1 + num_items])
     clean_name = instance_name.replace(".", "-")
-    return KnapsackInstance(
+    # The int() casts above already guarantee the element types, so skip
+    # the per-element Pydantic validation here; the server validates the
+    # instance again on upload.
+    return KnapsackInstance.model_construct(
         instance_uid=f"jooken/{clean_name}",
         origin=(
             "https://github.com/JorikJooken/knapsackProblemInstances | "
@@ -56,32 +74,72 @@ def parse_jooken_instance(instance_name: str, instance_path: Path) -> KnapsackIn
     )
 
 
-def download_and_extract_zip(url: str, target_zip: Path, extract_dir: Path) -> None:
+def _extract_member(
+    z: zipfile.ZipFile, info: zipfile.ZipInfo, extract_dir: Path
+) -> None:
+    target = extract_dir / info.filename
+    if not target.resolve().is_relative_to(extract_dir.resolve()):
+        raise ValueError(f"ZIP member escapes the extraction dir: {info.filename}")
+    if info.is_dir():
+        target.mkdir(parents=True, exist_ok=True)
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with z.open(info) as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, length=1 << 20)
+
+
+def download_and_extract_zip(url: str, extract_dir: Path) -> None:
     """
-    Download ZIP from URL to target_zip and extract to extract_dir.
-    Skips steps if paths already exist.
+    Download ZIP from URL and extract to extract_dir.
+    Skips the download if extract_dir already exists.
     """
-    if not target_zip.exists():
-        logger.info("Downloading %s to %s", url, target_zip)
-        response = requests.get(url, timeout=30)
+    if extract_dir.exists():
+        logger.info("%s exists, skipping download", extract_dir)
+        return
+
+    # Stream the response into a spooled temp file and extract straight
+    # from it: the old path buffered the whole archive in memory, wrote it
+    # to disk, and read it back again - three passes over hundreds of MB.
+    # The extracted directory marks the set as done, so no ZIP stays on
+    # disk. ZipFile needs a seekable file, hence the temp file rather
+    # than handing it the socket.
+    logger.info("Downloading %s and extracting to %s", url, extract_dir)
+    with requests.get(url, stream=True, timeout=30) as response:
         response.raise_for_status()
-        target_zip.write_bytes(response.content)
-    else:
-        logger.info("%s exists, skipping download", target_zip)
-
-    if not extract_dir.exists():
-        logger.info("Extracting %s to %s", target_zip, extract_dir)
-        with zipfile.ZipFile(target_zip, "r") as z:
-            z.extractall(extract_dir)
-    else:
-        logger.info("%s exists, skipping extraction", extract_dir)
+        with tempfile.SpooledTemporaryFile(max_size=1 << 28) as tmp:
+            shutil.copyfileobj(response.raw, tmp, length=1 << 20)
+            tmp.seek(0)
+            # Extract the members over a thread pool instead of the
+            # single-threaded extractall: ZipFile reads are internally
+            # locked, zlib releases the GIL during DEFLATE, and the
+            # archive holds thousands of tiny files whose writes can
+            # overlap.
+            with zipfile.ZipFile(tmp) as z:
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    for _ in executor.map(
+                        lambda info: _extract_member(z, info, extract_dir),
+                        z.infolist(),
+                    ):
+                        pass
 
 
 def find_instance_files(root_dir: Path) -> list[Path]:
     """
-    Return all files under root_dir ending with 'test.in'.
+    Return all files under root_dir named 'test.in'.
     """
-    files = list(root_dir.rglob("test.in"))
+    # Walk with os.scandir instead of rglob: the cached DirEntry type
+    # checks avoid a stat per entry and Path objects are only built for
+    # actual matches, which matters with the tens of thousands of files
+    # in the extracted Jooken tree.
+    files: list[Path] = []
+    stack = [str(root_dir)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name == "test.in":
+                    files.append(Path(entry.path))
     logger.info("Found %d instance files", len(files))
     return files
 
@@ -97,10 +155,9 @@ def main() -> None:
     )
     work_dir = Path(os.environ.get("WORK_DIR", Path.cwd()))
 
-    zip_path = work_dir / "jooken_master.zip"
     extract_dir = work_dir / "jooken_master"
 
-    download_and_extract_zip(zip_url, zip_path, extract_dir)
+    download_and_extract_zip(zip_url, extract_dir)
     instance_files = find_instance_files(extract_dir)
 
     connector = Connector(
@@ -109,13 +166,25 @@ def main() -> None:
         api_key=api_key,
     )
 
-    for path in instance_files:
-        instance_name = path.parent.name
-        logger.info("Processing %s", path)
-        knapsack_inst = parse_jooken_instance(instance_name, path)
-        logger.info("Uploading %s (uid=%s)", instance_name, knapsack_inst.instance_uid)
-        resp = connector.upload_instance(knapsack_inst)
-        logger.info("Response: %s", resp)
+    # Parse on a thread pool while the main thread drains the results into
+    # batched uploads: the file reads and the HTTP requests release the
+    # GIL, so parsing the next files overlaps with uploading the previous
+    # batch. Uploads stay in batches to amortize the HTTP round-trip; one
+    # POST per instance is latency-bound over thousands of Jooken files.
+    batch: list[KnapsackInstance] = []
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        parsed = executor.map(
+            lambda path: parse_jooken_instance(path.parent.name, path),
+            instance_files,
+        )
+        for knapsack_inst in parsed:
+            logger.info("Parsed %s", knapsack_inst.instance_uid)
+            batch.append(knapsack_inst)
+            if len(batch) >= UPLOAD_BATCH_SIZE:
+                connector.upload_instances(batch)
+                batch = []
+    if batch:
+        connector.upload_instances(batch)
 
     logger.info("Completed uploading %d instances.", len(instance_files))
 
@@ -1,6 +1,7 @@
 import logging
 from typing import Any
 from requests import Session
+from requests.adapters import HTTPAdapter
 from pydantic import BaseModel
 
 # Configure root logger – adjust level as needed
@@ -21,7 +22,13 @@ class Connector:
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.problem_uid = problem_uid
+        # One session for all calls so connections are kept alive; the
+        # enlarged adapter pool also covers populate scripts that drive the
+        # connector from multiple threads.
         self.session = Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         if api_key:
             # automatically include API key on all requests
             self.session.headers.update({"api-key": api_key})
@@ -91,6 +98,18 @@ class Connector:
         """Fetches information about a specific problem instance."""
         return self._request("GET", f"/instance_info/{instance_uid}")  # type: ignore
 
+    def get_all_instance_uids(self, page_size: int = 100) -> list[str]:
+        """Fetches the UIDs of all instances by paging through the instance info."""
+        uids: list[str] = []
+        offset = 0
+        while True:
+            response = self.get_all_instance_info(offset=offset, limit=page_size)
+            uids.extend(response["sorted_uids"])
+            offset += page_size
+            if not response["sorted_uids"] or offset >= response["total"]:
+                break
+        return uids
+
     def get_problem_info(self) -> dict[str, Any]:
         """Fetches information about the problem."""
         return self._request("GET", "/problem_info/")  # type: ignore
@@ -100,6 +119,11 @@ class Connector:
         payload = instance.model_dump(mode="json")
         return self._request("POST", "/instances", json=payload)  # type: ignore
 
+    def upload_instances(self, instances: list[BaseModel]) -> dict[str, Any]:
+        """Uploads multiple problem instances in a single request."""
+        payload = [instance.model_dump(mode="json") for instance in instances]
+        return self._request("POST", "/instances/batch", json=payload)  # type: ignore
+
     def delete_instance(self, instance_uid: str) -> dict[str, Any]:
         """Deletes a problem instance by its UID."""
         return self._request("DELETE", f"/instances/{instance_uid}")  # type: ignore
@@ -13,12 +13,30 @@ Functions:
 """
 
 from contextlib import contextmanager
+from sqlalchemy import event
 from sqlmodel import SQLModel, Session, create_engine
 import os
 
 database_path = os.getenv("IRB_DATABASE_PATH", "sqlite:///database.db")
 engine = create_engine(database_path)
 
+if engine.dialect.name == "sqlite":
+    # SQLite ships with conservative defaults; for this workload (many
+    # small index reads, occasional uploads) WAL mode lets readers run
+    # concurrently with a writer and NORMAL sync drops the per-commit
+    # fsync without risking corruption in WAL mode. A larger page cache
+    # (64 MB, the value is in KiB and negative by PRAGMA convention)
+    # keeps the hot index pages in memory. PostgreSQL deployments are
+    # unaffected.
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 
 @contextmanager
 def get_session():
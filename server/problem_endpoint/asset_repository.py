@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from .safe_file_operations import SafeFileOperations
@@ -9,7 +10,33 @@ class AssetRepository:
     def __init__(self, problem_info: InternalProblemInfo):
         self.problem_info = problem_info
         self.root = problem_info.assets_root
+        # The asset classes are fixed for the lifetime of the repository;
+        # snapshot them once instead of rebuilding the items view on every
+        # lookup in the per-instance methods below.
+        self._asset_entries = tuple(problem_info.assets.items())
         self._safe_file_ops = SafeFileOperations(self.root)
+        # Directory-listing cache for the existence probes in
+        # available_assets_for_instance; invalidated on every write.
+        self._dir_entries_cache: dict[Path, set[str]] = {}
+
+    def _dir_entries(self, directory: Path) -> set[str]:
+        """
+        Return the cached set of file names in the given directory. One
+        listdir per directory replaces a stat syscall per asset probe,
+        which matters on listing pages that check many instances.
+        """
+        entries = self._dir_entries_cache.get(directory)
+        if entries is None:
+            if not directory.is_relative_to(self.root):
+                raise ValueError(
+                    f"Path {directory} is outside the allowed directory {self.root}"
+                )
+            try:
+                entries = set(os.listdir(directory))
+            except FileNotFoundError:
+                entries = set()
+            self._dir_entries_cache[directory] = entries
+        return entries
 
     def add(self, asset_class, instance_uid, asset, exists_ok: bool = False) -> Path:
         """
@@ -23,6 +50,7 @@ class AssetRepository:
             raise ValueError(f"An asset with the uid {instance_uid} already exists")
         with open(asset_path, "wb") as file:
             file.write(asset)
+        self._dir_entries_cache.clear()
         return asset_path
 
     def delete_assets(self, instance_uid: str, asset_class: str | None = None):
@@ -41,9 +69,10 @@ class AssetRepository:
             )
             self._safe_file_ops.delete(asset_path)
         else:
-            for asset_class, extension in self.problem_info.assets.items():
+            for asset_class, extension in self._asset_entries:
                 asset_path = asset_dir / asset_class / f"{instance_uid}.{extension}"
                 self._safe_file_ops.delete(asset_path)
+        self._dir_entries_cache.clear()
 
     def available_assets_for_instance(self, instance_uid: str) -> dict[str, Path]:
         """
@@ -54,9 +83,12 @@ class AssetRepository:
         if not self._safe_file_ops.exists(asset_dir):
             return {}
         assets = {}
-        for asset_class, extension in self.problem_info.assets.items():
+        for asset_class, extension in self._asset_entries:
             asset_path = asset_dir / asset_class / f"{instance_uid}.{extension}"
-            if self._safe_file_ops.exists(asset_path):
+            # Membership in the cached directory listing replaces a stat
+            # syscall per asset class. The lookup is keyed on the parent
+            # directory, so uids with path separators work unchanged.
+            if asset_path.name in self._dir_entries(asset_path.parent):
                 assets[asset_class] = asset_path.relative_to(self.root)
         return assets
 
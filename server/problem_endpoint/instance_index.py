@@ -1,7 +1,13 @@
+import base64
+import json
 import logging
+import math
+from typing import Iterator
 
 from pydantic import BaseModel
+import sqlalchemy
 import sqlmodel
+from sqlalchemy.dialects import postgresql, sqlite
 
 from .instance_query_schema import _generate_query_schema
 
@@ -21,19 +27,100 @@ class InstanceIndex:
         self.problem_info = problem_info
         self.IndexTable = _generate_problem_instance_index_table(problem_info)
         self.QuerySchema = _generate_query_schema(problem_info)
+        # Cached COUNT(*) for queries without any filters; invalidated on
+        # every write so the hot "list all" path skips the count query.
+        self._unfiltered_total: int | None = None
+        # Cached (min, max) per range filter, lazily loaded from the
+        # RangeQueryBounds table; saves one SELECT per range filter per
+        # indexed instance, which is N+1 behavior during bulk imports.
+        self._bounds_cache: dict[str, tuple[float | None, float | None]] | None = (
+            None
+        )
+        # Precomputed column and query-field lookups for the hot query
+        # path; the field names and columns are fixed once the classes
+        # are generated, so the f-string builds and getattr chains do not
+        # need to be repeated per request.
+        postfix = problem_info.postfix_query
+        self._uid_col = getattr(self.IndexTable, problem_info.uid_attribute)
+        self._index_field_names = tuple(self.IndexTable.model_fields.keys())
+        self._range_specs = [
+            (
+                getattr(self.IndexTable, field_name),
+                f"{field_name}{postfix}{problem_info.postfix_query_geq}",
+                f"{field_name}{postfix}{problem_info.postfix_query_leq}",
+            )
+            for field_name in problem_info.range_filters
+        ]
+        self._bool_specs = [
+            (getattr(self.IndexTable, field_name), f"{field_name}{postfix}")
+            for field_name in problem_info.boolean_filters
+        ]
+        self._sort_columns = {
+            field_name: getattr(self.IndexTable, field_name)
+            for field_name in problem_info.sort_fields
+        }
+        # Prefix search compiles to LIKE 'term%', which the uid primary
+        # key index can serve; substring search (the default) has to scan
+        # the table but matches anywhere in the uid.
+        self._search_op = (
+            self._uid_col.startswith
+            if problem_info.search_mode == "prefix"
+            else self._uid_col.contains
+        )
+        # Base statements for the query path. select() constructs are
+        # immutable and every generative call (.where, .order_by, ...)
+        # returns a new object, so the shared bases can be built once and
+        # safely extended per request. The list query selects plain
+        # columns rather than the ORM entity: the rows are only
+        # serialized into the response, so there is no point in paying
+        # for identity-map bookkeeping and attribute instrumentation on
+        # every row.
+        self._base_select = sqlmodel.select(*self.IndexTable.__table__.columns)
+        self._base_count = sqlmodel.select(sqlmodel.func.count()).select_from(
+            self.IndexTable
+        )
+        # Core UPDATE for re-indexing an existing row; the SET clauses
+        # are derived from the parameter names at execution time. The
+        # bind name must not collide with a column name.
+        self._update_statement = sqlalchemy.update(self.IndexTable.__table__).where(
+            self._uid_col == sqlalchemy.bindparam("uid_")
+        )
         logging.info(
             "InstanceIndex initialized with problem_uid=%s", problem_info.problem_uid
         )
 
+    @staticmethod
+    def _encode_cursor(sort_value, instance_uid: str) -> str:
+        """
+        Encode the keyset position (sort value and uid of the last row of
+        a page) as an opaque cursor.
+        """
+        payload = json.dumps([sort_value, instance_uid])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple:
+        try:
+            sort_value, instance_uid = json.loads(
+                base64.urlsafe_b64decode(cursor.encode())
+            )
+        except (ValueError, TypeError) as err:
+            raise ValueError(f"Invalid pagination cursor: {cursor!r}") from err
+        return sort_value, instance_uid
+
     def exists(self, instance_uid: str, session: sqlmodel.Session) -> bool:
         """
         Check if an instance with the given instance_uid exists.
         """
-        exists = session.get(self.IndexTable, instance_uid) is not None
-        logging.debug(
-            "Checked existence of instance with uid=%s: %s", instance_uid, exists
+        # SELECT 1 instead of session.get: no need to fetch and
+        # materialize the full row just to check presence.
+        statement = (
+            sqlmodel.select(sqlmodel.literal(1))
+            .select_from(self.IndexTable)
+            .where(self._uid_col == instance_uid)
+            .limit(1)
         )
-        return exists
+        return session.exec(statement).first() is not None
 
     def get_instance_metadata(
         self, instance_uid: str, session: sqlmodel.Session
@@ -42,12 +129,7 @@ class InstanceIndex:
         Get the instance info from the index table.
         """
         instance = session.get(self.IndexTable, instance_uid)
-        if instance:
-            logging.debug(
-                "Retrieved metadata for instance with uid=%s from the index table",
-                instance_uid,
-            )
-        else:
+        if not instance:
             logging.warning(
                 "No metadata found for instance with uid=%s in the index table",
                 instance_uid,
@@ -60,22 +142,31 @@ class InstanceIndex:
         """
         Create an instance of the instance model from the data.
         """
-        instance_info = self.IndexTable(**instance_data.model_dump())
-        logging.debug(
-            "Converted instance data to IndexTable instance for problem_uid=%s",
-            self.problem_info.problem_uid,
+        # Pick only the index fields directly from the (already validated)
+        # instance instead of dumping the full model: the index table is a
+        # narrow subset and a recursive model_dump would serialize every
+        # nested field just to throw most of it away.
+        return self.IndexTable(
+            **{key: getattr(instance_data, key) for key in self._index_field_names}
         )
-        return instance_info
 
     def deindex_instance(self, instance_uid: str, session: sqlmodel.Session):
         """
         Remove the instance with the given instance_uid from the index.
         Note that the file is not deleted as it is not a responsibility of the index.
         """
-        instance_index = session.get(self.IndexTable, instance_uid)
-        if instance_index:
-            session.delete(instance_index)
-            session.commit()
+        # A single DELETE ... WHERE instead of SELECT-then-delete; the
+        # rowcount tells us whether the instance existed.
+        result = session.execute(
+            sqlalchemy.delete(self.IndexTable).where(self._uid_col == instance_uid)
+        )
+        session.commit()
+        if result.rowcount > 0:
+            self._unfiltered_total = None
+            # The incremental widening on indexing never shrinks bounds,
+            # so removing an instance can leave them wider than the data;
+            # recompute them from the table.
+            self.recompute_range_bounds(session)
             logging.info(
                 "Deindexed instance with uid=%s for problem_uid=%s",
                 instance_uid,
@@ -88,14 +179,82 @@ class InstanceIndex:
                 self.problem_info.problem_uid,
             )
 
-    def index_instance(
+    def _load_bounds_cache(self, session: sqlmodel.Session):
+        if self._bounds_cache is None:
+            statement = sqlmodel.select(RangeQueryBounds).where(
+                RangeQueryBounds.problem_uid == self.problem_info.problem_uid
+            )
+            self._bounds_cache = {
+                bounds.field_name: (bounds.min_val, bounds.max_val)
+                for bounds in session.exec(statement)
+            }
+
+    def _widen_bounds(
+        self, field_name: str, lo: float, hi: float, session: sqlmodel.Session
+    ):
+        """
+        Widen the stored range-query bounds of the field to cover
+        [lo, hi]. The bounds are kept in an in-memory cache, so once they
+        have settled the common case costs no query at all; an actual
+        widening is written through session.merge.
+        """
+        min_val, max_val = self._bounds_cache.get(field_name, (None, None))
+        if min_val is not None and min_val <= lo and hi <= max_val:
+            return
+        new_min = lo if min_val is None or lo < min_val else min_val
+        new_max = hi if max_val is None or hi > max_val else max_val
+        session.merge(
+            RangeQueryBounds(
+                problem_uid=self.problem_info.problem_uid,
+                field_name=field_name,
+                min_val=new_min,
+                max_val=new_max,
+            )
+        )
+        self._bounds_cache[field_name] = (new_min, new_max)
+
+    def recompute_range_bounds(self, session: sqlmodel.Session):
+        """
+        Recompute the stored range-query bounds from the index table,
+        with one indexed MIN/MAX aggregate per range field. Unlike the
+        incremental widening during indexing, this also shrinks bounds
+        and is therefore what deletions use.
+        """
+        for field_name in self.problem_info.range_filters:
+            column = getattr(self.IndexTable, field_name)
+            min_val, max_val = session.execute(
+                sqlmodel.select(sqlmodel.func.min(column), sqlmodel.func.max(column))
+            ).one()
+            session.merge(
+                RangeQueryBounds(
+                    problem_uid=self.problem_info.problem_uid,
+                    field_name=field_name,
+                    min_val=min_val,
+                    max_val=max_val,
+                )
+            )
+            if self._bounds_cache is not None:
+                self._bounds_cache[field_name] = (min_val, max_val)
+        session.commit()
+
+    def _update_range_bounds(self, instance: BaseModel, session: sqlmodel.Session):
+        """
+        Widen the stored range-query bounds to cover the instance.
+        """
+        self._load_bounds_cache(session)
+        for field_name in self.problem_info.range_filters:
+            value = getattr(instance, field_name)
+            if not math.isfinite(value):
+                continue
+            self._widen_bounds(field_name, value, value, session)
+
+    def _stage_instance(
         self, instance: BaseModel, session: sqlmodel.Session
     ) -> sqlmodel.SQLModel:
         """
-        Index the instance with the given instance_uid.
-        It will be in problem_info.path/instances/instance_uid.json.xz
+        Stage the index row and bounds updates for the instance without
+        committing, so callers can batch several instances per commit.
         """
-        instance_index = self.get_instance_info_from_data(instance)
         instance_uid = getattr(instance, self.problem_info.uid_attribute)
         logging.info(
             "Indexing instance with uid=%s for problem_uid=%s",
@@ -104,42 +263,100 @@ class InstanceIndex:
         )
 
         # Check if the instance already exists in the index
-        existing_instance = session.get(
-            self.IndexTable, getattr(instance, self.problem_info.uid_attribute)
-        )
-        if existing_instance:
-            for key, value in instance_index.model_dump().items():
-                if key != self.problem_info.uid_attribute:
-                    setattr(existing_instance, key, value)
-            session.refresh(existing_instance)
+        instance_index = self.get_instance_info_from_data(instance)
+        if self.exists(instance_uid, session):
+            # One Core UPDATE instead of hydrating the existing row and
+            # mutating it attribute by attribute through the ORM
+            # instrumentation.
+            session.execute(
+                self._update_statement,
+                {
+                    "uid_": instance_uid,
+                    **{
+                        key: getattr(instance, key)
+                        for key in self._index_field_names
+                        if key != self.problem_info.uid_attribute
+                    },
+                },
+            )
         else:
             session.add(instance_index)
 
-        # update range query bounds
-        for field_name in self.problem_info.range_filters:
-            value = getattr(instance, field_name)
-            bounds = session.get(
-                RangeQueryBounds, (self.problem_info.problem_uid, field_name)
-            )
-            if bounds is None:
-                bounds = RangeQueryBounds(
-                    problem_uid=self.problem_info.problem_uid, field_name=field_name
-                )
-                session.add(bounds)
-            if bounds.update(value):
-                session.add(bounds)
+        self._update_range_bounds(instance, session)
+        return instance_index
 
+    def index_instance(
+        self, instance: BaseModel, session: sqlmodel.Session
+    ) -> sqlmodel.SQLModel:
+        """
+        Index the instance with the given instance_uid.
+        It will be in problem_info.path/instances/instance_uid.json.xz
+        """
+        instance_index = self._stage_instance(instance, session)
         session.commit()
+        self._unfiltered_total = None
         return instance_index
 
-    def get_instance_uids(self, session: sqlmodel.Session) -> list[str]:
+    def bulk_index(self, instances, session: sqlmodel.Session):
+        """
+        Index several instances with a single commit. This is what the
+        batch upload endpoint uses; committing once per batch instead of
+        once per instance amortizes the flush and fsync cost. On SQLite
+        and PostgreSQL the rows go in as one executemany upsert, which
+        also drops the per-row SELECT-before-INSERT existence check.
+        """
+        instances = list(instances)
+        if not instances:
+            return
+        dialect_insert = {
+            "sqlite": sqlite.insert,
+            "postgresql": postgresql.insert,
+        }.get(session.get_bind().dialect.name)
+        if dialect_insert is None:
+            # No native upsert on this backend; fall back to the
+            # ORM path, still with a single commit.
+            for instance in instances:
+                self._stage_instance(instance, session)
+        else:
+            uid_attribute = self.problem_info.uid_attribute
+            rows = [
+                {key: getattr(instance, key) for key in self._index_field_names}
+                for instance in instances
+            ]
+            statement = dialect_insert(self.IndexTable.__table__)
+            statement = statement.on_conflict_do_update(
+                index_elements=[uid_attribute],
+                set_={
+                    key: statement.excluded[key]
+                    for key in self._index_field_names
+                    if key != uid_attribute
+                },
+            )
+            session.execute(statement, rows)
+            # Widen each range bound once per batch instead of once per
+            # instance.
+            self._load_bounds_cache(session)
+            for field_name in self.problem_info.range_filters:
+                values = [
+                    value
+                    for instance in instances
+                    if math.isfinite(value := getattr(instance, field_name))
+                ]
+                if values:
+                    self._widen_bounds(field_name, min(values), max(values), session)
+        session.commit()
+        self._unfiltered_total = None
+
+    def get_instance_uids(self, session: sqlmodel.Session) -> Iterator[str]:
         """
-        Get the unique identifiers of all instances.
+        Iterate over the unique identifiers of all instances. The uids are
+        streamed from the database in chunks instead of materialized into
+        one list, which keeps the index sync memory-flat for large tables.
         """
-        statement = sqlmodel.select(
-            getattr(self.IndexTable, self.problem_info.uid_attribute)
+        statement = sqlmodel.select(self._uid_col).execution_options(
+            yield_per=1000
         )
-        return list(session.exec(statement).all())
+        yield from session.exec(statement)
 
     def get_range_query_bounds(
         self, session: sqlmodel.Session
@@ -158,71 +375,119 @@ class InstanceIndex:
         """
         Build a SQLAlchemy query based on the query_schema.
         """
-        statement = sqlmodel.select(self.IndexTable)
+        # Collect the filter criteria first so they can be applied to both
+        # the data query and the count query without a subquery wrapper.
+        criteria = []
         # Add the range filters
-        for field_name in self.problem_info.range_filters:
-            min_field_name = f"{field_name}{self.problem_info.postfix_query}{self.problem_info.postfix_query_geq}"
-            max_field_name = f"{field_name}{self.problem_info.postfix_query}{self.problem_info.postfix_query_leq}"
+        for column, min_field_name, max_field_name in self._range_specs:
             min_val = getattr(query_schema, min_field_name)
             max_val = getattr(query_schema, max_field_name)
             if min_val is not None:
-                statement = statement.filter(
-                    getattr(self.IndexTable, field_name) >= min_val
-                )
+                criteria.append(column >= min_val)
             if max_val is not None:
-                statement = statement.filter(
-                    getattr(self.IndexTable, field_name) <= max_val
-                )
+                criteria.append(column <= max_val)
 
         # Add the boolean filters
-        for field_name in self.problem_info.boolean_filters:
-            field_name_ = f"{field_name}{self.problem_info.postfix_query}"
-            if getattr(query_schema, field_name_) is not None:
-                statement = statement.filter(
-                    getattr(self.IndexTable, field_name)
-                    == getattr(query_schema, field_name_)
-                )
+        for column, query_field_name in self._bool_specs:
+            value = getattr(query_schema, query_field_name)
+            if value is not None:
+                criteria.append(column == value)
 
         # Add the search field
         if query_schema.search is not None:
-            statement = statement.filter(
-                getattr(self.IndexTable, self.problem_info.uid_attribute).contains(
-                    query_schema.search
-                )
-            )
+            criteria.append(self._search_op(query_schema.search))
+
+        statement = self._base_select.where(*criteria)
 
-        # Add the sort field
+        # Add the sort field. The uid is always appended as a tie-breaker
+        # so the order is total and keyset pagination can resume
+        # deterministically behind the last row of a page.
+        uid_col = self._uid_col
+        sort_field_name = None
+        descending = False
         if query_schema.sort_by is not None:
-            if query_schema.sort_by[0] == "-":
-                field_name = query_schema.sort_by[1:]
-                statement = statement.order_by(
-                    getattr(self.IndexTable, field_name).desc()
+            sort_field_name = query_schema.sort_by
+            if sort_field_name[0] == "-":
+                sort_field_name = sort_field_name[1:]
+                descending = True
+            sort_col = self._sort_columns.get(sort_field_name)
+            if sort_col is None:
+                # Not a declared sort field; resolve it dynamically as
+                # before so sorting by other indexed columns keeps working.
+                sort_col = getattr(self.IndexTable, sort_field_name)
+            statement = statement.order_by(
+                sort_col.desc() if descending else sort_col, uid_col
+            )
+        else:
+            sort_col = None
+            statement = statement.order_by(uid_col)
+
+        # Count before the pagination predicates so `total` reflects all
+        # matching rows. The count runs directly against the table with
+        # the same criteria instead of wrapping the ordered statement in a
+        # subquery, and the unfiltered total is served from the cache.
+        if criteria:
+            total = session.exec(self._base_count.where(*criteria)).first()
+        else:
+            if self._unfiltered_total is None:
+                self._unfiltered_total = session.exec(self._base_count).first()
+            total = self._unfiltered_total
+
+        # Add the pagination. With a cursor, seek directly behind the last
+        # row of the previous page instead of making the database scan and
+        # discard `offset` rows; deep pages then cost the same as the
+        # first one. The plain offset path is kept for clients without
+        # cursor support.
+        if query_schema.cursor is not None:
+            last_sort_value, last_uid = self._decode_cursor(query_schema.cursor)
+            if sort_col is None:
+                statement = statement.filter(uid_col > last_uid)
+            elif descending:
+                statement = statement.filter(
+                    sqlmodel.or_(
+                        sort_col < last_sort_value,
+                        sqlmodel.and_(
+                            sort_col == last_sort_value, uid_col > last_uid
+                        ),
+                    )
                 )
             else:
-                statement = statement.order_by(
-                    getattr(self.IndexTable, query_schema.sort_by)
+                statement = statement.filter(
+                    sqlmodel.or_(
+                        sort_col > last_sort_value,
+                        sqlmodel.and_(
+                            sort_col == last_sort_value, uid_col > last_uid
+                        ),
+                    )
                 )
+            statement = statement.limit(query_schema.limit)
+        else:
+            statement = statement.offset(query_schema.offset).limit(
+                query_schema.limit
+            )
 
-        # Add the pagination
-        count_statement = sqlmodel.select(sqlmodel.func.count()).select_from(
-            statement.alias()
-        )
-        statement = statement.offset(query_schema.offset).limit(query_schema.limit)
-
-        total = session.exec(count_statement).first()
-        items = session.exec(statement).all()
-
-        return PaginatedInstanceResponse(
-            sorted_uids=[
-                getattr(item, self.problem_info.uid_attribute) for item in items
-            ],
-            data={
-                getattr(item, self.problem_info.uid_attribute): item.model_dump()
-                for item in items
-            },
+        rows = session.execute(statement).mappings().all()
+
+        uid_attribute = self.problem_info.uid_attribute
+        next_cursor = None
+        if rows and len(rows) == query_schema.limit:
+            last_row = rows[-1]
+            next_cursor = self._encode_cursor(
+                last_row[sort_field_name] if sort_field_name else None,
+                last_row[uid_attribute],
+            )
+
+        # model_construct skips validation: the rows come straight from
+        # the database and FastAPI validates the response against the
+        # response_model anyway, so validating here as well would check
+        # every row twice.
+        return PaginatedInstanceResponse.model_construct(
+            sorted_uids=[row[uid_attribute] for row in rows],
+            data={row[uid_attribute]: dict(row) for row in rows},
             assets={},
             download_links={},
             offset=query_schema.offset,
             limit=query_schema.limit,
             total=total if total else 0,
+            next_cursor=next_cursor,
         )
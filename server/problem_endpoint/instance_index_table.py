@@ -1,12 +1,20 @@
 import logging
 
 from typing import Type
+import sqlalchemy
 import sqlmodel
 from sqlmodel.main import SQLModelMetaclass
 
 from .problem_info import InternalProblemInfo
 
 
+# Cache of generated table classes: building a SQLModel class compiles a
+# full pydantic-core schema and registers the table in the shared metadata,
+# both of which are expensive and must not happen twice for the same table
+# name. Keyed by the problem uid and its field configuration.
+_INDEX_TABLE_CACHE: dict[tuple, Type[sqlmodel.SQLModel]] = {}
+
+
 def _generate_problem_instance_index_table(
     problem_info: InternalProblemInfo,
 ) -> Type[sqlmodel.SQLModel]:
@@ -14,6 +22,28 @@ def _generate_problem_instance_index_table(
     Creates a SQLModel class that represents the index table for the instances of the problem.
     It is automatically generated based on the information provided in the problem_info parameter.
     """
+    # dict.fromkeys dedupes while keeping the configured order, so the
+    # generated columns (and with them CREATE TABLE statements and
+    # schema diffs) are deterministic across runs, unlike a set.
+    field_names = tuple(
+        field_name
+        for field_name in dict.fromkeys(
+            problem_info.range_filters
+            + problem_info.boolean_filters
+            + problem_info.sort_fields
+            + problem_info.display_fields
+        )
+        if field_name != problem_info.uid_attribute
+    )
+    cache_key = (
+        problem_info.problem_uid,
+        problem_info.uid_attribute,
+        field_names,
+    )
+    cached_class = _INDEX_TABLE_CACHE.get(cache_key)
+    if cached_class is not None:
+        return cached_class
+
     annotations = {}
     class_name = f"{problem_info.problem_uid.replace('-', '_')}_instances"
     class_dict = {
@@ -40,17 +70,18 @@ def _generate_problem_instance_index_table(
     )
 
     # Create other fields
-    for field_name in set(
-        problem_info.range_filters
-        + problem_info.boolean_filters
-        + problem_info.sort_fields
-        + problem_info.display_fields
-    ) - {uid_attribute}:
+    for field_name in field_names:
         annotations[field_name] = problem_info.instance_model.__annotations__[
             field_name
         ]
+        # Index the filter columns so range and boolean queries seek
+        # instead of scanning the whole table.
         class_dict[field_name] = sqlmodel.Field(
             ...,
+            index=(
+                field_name in problem_info.range_filters
+                or field_name in problem_info.boolean_filters
+            ),
             description=problem_info.instance_model.model_fields[
                 field_name
             ].description,
@@ -61,6 +92,21 @@ def _generate_problem_instance_index_table(
             problem_info.problem_uid,
         )
 
+    # Composite (sort column, uid) indexes: the query path always orders
+    # by the sort field with the uid as tie-breaker, so these let both the
+    # ordering and the keyset-pagination seek run off a single index.
+    table_args = tuple(
+        sqlalchemy.Index(
+            f"ix_{class_name}_{field_name}_{uid_attribute}",
+            field_name,
+            uid_attribute,
+        )
+        for field_name in problem_info.sort_fields
+        if field_name != uid_attribute
+    )
+    if table_args:
+        class_dict["__table_args__"] = table_args
+
     class_dict["__annotations__"] = annotations  # type: ignore
 
     # Use the SQLModel metaclass to create the class and pass table=True
@@ -72,4 +118,5 @@ def _generate_problem_instance_index_table(
         class_name,
         problem_info.problem_uid,
     )
+    _INDEX_TABLE_CACHE[cache_key] = model_class  # type: ignore
     return model_class  # type: ignore
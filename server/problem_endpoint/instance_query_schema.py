@@ -7,12 +7,29 @@ from typing import Type
 from .problem_info import InternalProblemInfo
 
 
+# Cache of generated query schemas: pydantic-core schema compilation is
+# expensive per class, so repeated InstanceIndex constructions for the
+# same problem reuse the class. Keyed by the problem uid and the field
+# configuration the schema is derived from.
+_QUERY_SCHEMA_CACHE: dict[tuple, Type[BaseModel]] = {}
+
+
 def _generate_query_schema(problem_info: InternalProblemInfo) -> Type[BaseModel]:
     """
     Generate a query model for the instances of the problem.
     This model can then be used to validate the query parameters of the API endpoint,
     as well as to automatically build the SQL query.
     """
+    cache_key = (
+        problem_info.problem_uid,
+        tuple(problem_info.range_filters),
+        tuple(problem_info.boolean_filters),
+        tuple(problem_info.sort_fields),
+    )
+    cached_class = _QUERY_SCHEMA_CACHE.get(cache_key)
+    if cached_class is not None:
+        return cached_class
+
     annotations = {}
     class_name = f"{problem_info.problem_uid.replace('-', '_')}_query"
     class_dict = {}
@@ -89,6 +106,15 @@ def _generate_query_schema(problem_info: InternalProblemInfo) -> Type[BaseModel]
     logging.debug("Added 'search' field for problem_uid=%s", problem_info.problem_uid)
 
     # Pagination
+    assert "cursor" not in annotations, "`cursor` is a reserved field name"
+    class_dict["cursor"] = Field(
+        None,
+        description=(
+            "Opaque cursor for keyset pagination, taken from the `next_cursor` "
+            "field of a previous response. When set, `offset` is ignored."
+        ),
+    )
+    annotations["cursor"] = str | None
     assert "offset" not in annotations, "`offset` is a reserved field name"
     class_dict["offset"] = Field(0, description="The offset of the current page")
     annotations["offset"] = int
@@ -108,4 +134,5 @@ def _generate_query_schema(problem_info: InternalProblemInfo) -> Type[BaseModel]
         class_name,
         problem_info.problem_uid,
     )
+    _QUERY_SCHEMA_CACHE[cache_key] = model_class
     return model_class
@@ -1,6 +1,5 @@
 from pydantic import BaseModel, Field
 import sqlmodel
-import math
 
 
 class PaginatedInstanceResponse(BaseModel):
@@ -20,6 +19,13 @@ class PaginatedInstanceResponse(BaseModel):
     offset: int = Field(..., description="The offset of the current page")
     limit: int = Field(..., description="The limit of the current page")
     total: int = Field(..., description="The total number of items")
+    next_cursor: str | None = Field(
+        default=None,
+        description=(
+            "Opaque cursor for fetching the page after this one via keyset "
+            "pagination; None if this is the last page."
+        ),
+    )
 
 
 class RangeQueryBounds(sqlmodel.SQLModel, table=True):
@@ -33,29 +39,6 @@ class RangeQueryBounds(sqlmodel.SQLModel, table=True):
     min_val: float | None = sqlmodel.Field(default=None)
     max_val: float | None = sqlmodel.Field(default=None)
 
-    def update(self, val: float) -> bool:
-        """
-        Update the bounds based on the new value.
-        """
-
-        # don't do anything if it is not a number
-        if not math.isfinite(val):
-            return False
-
-        if self.min_val is None or self.max_val is None:
-            self.min_val = val
-            self.max_val = val
-            return True
-
-        changed = False
-        if val < self.min_val:
-            self.min_val = val
-            changed = True
-        if val > self.max_val:
-            self.max_val = val
-            changed = True
-        return changed
-
 
 class ProblemInfoResponse(BaseModel):
     """
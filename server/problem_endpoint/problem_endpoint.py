@@ -43,13 +43,13 @@ class ProblemEndpoint:
 
     def sync_instance_index(self, session: Session):
         logging.info(f"Syncing instance index for {self.problem_info.problem_uid}")
-        instance_uids_in_db = self.instance_index.get_instance_uids(session)
-        instance_uids_in_repo = self.instance_repository.get_all_instance_uids()
+        instance_uids_in_db = set(self.instance_index.get_instance_uids(session))
+        instance_uids_in_repo = set(self.instance_repository.get_all_instance_uids())
 
-        for instance_uid in set(instance_uids_in_db) - set(instance_uids_in_repo):
+        for instance_uid in instance_uids_in_db - instance_uids_in_repo:
             self.instance_index.deindex_instance(instance_uid, session)
 
-        for instance_uid in set(instance_uids_in_repo) - set(instance_uids_in_db):
+        for instance_uid in instance_uids_in_repo - instance_uids_in_db:
             instance = self.instance_repository.read_instance(instance_uid)
             self.instance_index.index_instance(instance, session)
 
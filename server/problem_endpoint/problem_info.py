@@ -63,6 +63,10 @@ class ProblemInfo(BaseModel):
         default_factory=dict,
         description="The asset classes and their extensions. The keys are the asset classes, and the values are the extensions, e.g., {'image': 'png'}.",
     )
+    search_mode: str = Field(
+        default="substring",
+        description="How the `search` query argument matches instance uids. 'substring' uses LIKE '%term%' (flexible but scans the whole table), 'prefix' uses LIKE 'term%' which can be served by the uid index.",
+    )
     solution_index_field: str = Field(
         default="solution_uid",
         description="The attribute of the solution that contains the unique identifier",
@@ -196,6 +200,9 @@ def load_problem_info_from_file(path: Path) -> InternalProblemInfo:
         raise ValueError(
             "The POSTFIX_QUERY_GEQ is not valid. It should only contain alphanumeric characters and underscores."
         )
+    search_mode = problem_vars.get("SEARCH_MODE", "substring")
+    if search_mode not in ("substring", "prefix"):
+        raise ValueError("SEARCH_MODE must be either 'substring' or 'prefix'")
     # Create the ProblemInfo instance
     url_root = os.getenv("IRB_REPOSITORY_URL", "/").rstrip("/")
     subpath_str = str(subpath).rstrip("/")
@@ -217,6 +224,7 @@ def load_problem_info_from_file(path: Path) -> InternalProblemInfo:
         postfix_query=postfix_query,
         postfix_query_leq=postfix_query_leq,
         postfix_query_geq=postfix_query_geq,
+        search_mode=search_mode,
         assets=assets,
         solution_model=solution_schema,
         solution_sort_by=solution_sort_attributes,
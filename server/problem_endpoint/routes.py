@@ -64,7 +64,11 @@ def build_routes_for_problem(
         """
         Query instance metadata with pagination and filtering support.
         """
-        response = instance_index.query(query, session)
+        try:
+            response = instance_index.query(query, session)
+        except ValueError as ve:
+            # e.g. a malformed pagination cursor
+            raise HTTPException(status_code=400, detail=str(ve))
         # add assets info
         if problem_info.assets:
             for instance_uid in response.sorted_uids:
@@ -128,6 +132,23 @@ def build_routes_for_problem(
         instance_repository.write_instance(instance)
         instance_index.index_instance(instance, session)
 
+    @router.post("/instances/batch")
+    def create_instances(
+        instances: list[InstanceModel],  # type: ignore
+        session: Session = Depends(get_db),
+        api_key: str = Depends(verify_api_key),
+    ):
+        """
+        Create multiple instances in one request. This amortizes the HTTP
+        round-trip when populating the repository with large benchmark sets.
+        Re-sending a batch is safe: existing files are overwritten, matching
+        the upsert semantics of the index, so interrupted populate scripts
+        can simply be rerun.
+        """
+        for instance in instances:
+            instance_repository.write_instance(instance, overwrite=True)
+        instance_index.bulk_index(instances, session)
+
     @router.delete("/instances/{instance_uid:path}")
     def delete_instance(
         instance_uid: str,